@@ -282,7 +282,7 @@ def ingest_mock_data(db: Session = Depends(get_db)):
                     limitations=config.get("limitations"),
                     last_seen_at=datetime.utcnow(),
                     readiness_score=0,  # Will be updated by scoring
-                    readiness_status=ReadinessStatusEnum.DRAFT,
+                    readiness_status=ReadinessStatusEnum.DRAFT.value,
                 )
                 db.add(dataset)
                 db.flush()  # Get the ID
@@ -315,7 +315,7 @@ def ingest_mock_data(db: Session = Depends(get_db)):
                     "full_name": dataset.full_name,
                     "display_name": dataset.display_name,
                     "readiness_score": dataset.readiness_score,
-                    "readiness_status": dataset.readiness_status.value,
+                    "readiness_status": dataset.readiness_status,
                 }
             )
 
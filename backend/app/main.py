@@ -2,17 +2,30 @@
 FastAPI application entry point.
 """
 
+from typing import Any
+
+import orjson
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from app.api import ai, datasets, health, ingest
 from app.config import settings
 
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Ondo API",
     description="Dataset readiness scoring API",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
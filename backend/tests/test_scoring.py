@@ -4,62 +4,132 @@ Unit tests for the scoring engine.
 Tests cover various scenarios from perfect scores to minimal datasets.
 """
 
+import functools
+import json
+from types import MappingProxyType
+
 import pytest
 
 from app.scoring.engine import score_dataset
 from app.scoring.types import ReadinessStatus
 
 
-class TestScoringEngine:
-    """Test suite for the scoring engine."""
-
-    def test_perfect_gold_dataset(self):
-        """Test a perfect dataset that should score 100 (Gold status)."""
-        metadata = {
+@functools.lru_cache(maxsize=128)
+def _score_cached(frozen_metadata):
+    return score_dataset(json.loads(frozen_metadata))
+
+
+def _score(metadata):
+    """Score metadata, reusing the result for metadata already scored in this process.
+
+    Results are shared between tests, so tests must only read them.
+    """
+    return _score_cached(json.dumps(metadata, sort_keys=True, default=dict))
+
+
+def _by_key(result):
+    """Index a result's dimension scores by dimension_key."""
+    return {d.dimension_key: d for d in result.dimension_scores}
+
+
+# Read-only so tests sharing it can't leak changes into each other
+GOLD_METADATA = MappingProxyType({
+    "owner_name": "Data Team",
+    "owner_contact": "#data-team",
+    "description": "Comprehensive user events table",
+    "columns": (
+        MappingProxyType({"name": "user_id", "description": "Unique user identifier"}),
+        MappingProxyType({"name": "event_type", "description": "Type of event"}),
+        MappingProxyType({"name": "timestamp", "description": "Event timestamp"}),
+        MappingProxyType({"name": "event_data", "description": "Event payload"}),
+    ),
+    "intended_use": "Analytics, experimentation, ML training",
+    "limitations": "Data delayed by 1 hour for processing",
+    "has_freshness_checks": True,
+    "has_volume_checks": True,
+    "dbt_test_count": 5,
+    "has_sla": True,
+    "breaking_changes_30d": 0,
+    "has_release_notes": True,
+    "has_versioning": True,
+    "backward_compatible": True,
+})
+
+# (metadata, inclusive total_score range, expected status)
+SCORING_CASES = [
+    pytest.param(GOLD_METADATA, (100, 100), ReadinessStatus.GOLD, id="perfect_gold"),
+    pytest.param({}, (0, 0), ReadinessStatus.DRAFT, id="minimal_draft"),
+    pytest.param(
+        {
+            "owner_name": "John Doe",
+            "owner_contact": "john@example.com",
+        },
+        (15, 15),
+        ReadinessStatus.DRAFT,
+        id="partial_ownership_only",
+    ),
+    pytest.param(
+        {
             "owner_name": "Data Team",
             "owner_contact": "#data-team",
-            "description": "Comprehensive user events table",
+            "description": "User analytics table",
             "columns": [
-                {"name": "user_id", "description": "Unique user identifier"},
-                {"name": "event_type", "description": "Type of event"},
-                {"name": "timestamp", "description": "Event timestamp"},
-                {"name": "event_data", "description": "Event payload"},
+                {"name": "user_id", "description": "User ID"},
+                {"name": "event_type", "description": "Event type"},
+                {"name": "timestamp"},  # Missing description
+                {"name": "data"},  # Missing description
             ],
-            "intended_use": "Analytics, experimentation, ML training",
-            "limitations": "Data delayed by 1 hour for processing",
+            "intended_use": "Analytics",
+            "limitations": "Some data quality issues",
             "has_freshness_checks": True,
-            "has_volume_checks": True,
-            "dbt_test_count": 5,
-            "has_sla": True,
-            "breaking_changes_30d": 0,
-            "has_release_notes": True,
-            "has_versioning": True,
-            "backward_compatible": True,
-        }
-
-        result = score_dataset(metadata)
+            "has_volume_checks": False,
+            "has_sla": False,
+            "has_release_notes": False,
+        },
+        (70, 84),
+        ReadinessStatus.PRODUCTION_READY,
+        id="production_ready_with_gaps",
+    ),
+    pytest.param(
+        {
+            "owner_name": "Team C",
+            "description": "Some description",
+            "columns": [
+                {"name": "id", "description": "ID"},
+                {"name": "name", "description": "Name"},
+            ],
+            "intended_use": "Internal use",
+            "has_freshness_checks": True,
+        },
+        (50, 69),
+        ReadinessStatus.INTERNAL,
+        id="internal_status",
+    ),
+]
 
-        assert result.total_score == 100
-        assert result.status == ReadinessStatus.GOLD
-        assert len(result.dimension_scores) == 6
-        assert all(dim.points_awarded == dim.max_points for dim in result.dimension_scores)
-        assert len(result.reasons) == 0
-        # Should still have some actions for continuous improvement
-        assert len(result.actions) >= 0
 
-    def test_minimal_draft_dataset(self):
-        """Test a minimal dataset with no metadata (should be Draft)."""
-        metadata = {}
+class TestScoringEngine:
+    """Test suite for the scoring engine."""
 
-        result = score_dataset(metadata)
+    @pytest.mark.parametrize("metadata,score_range,status", SCORING_CASES)
+    def test_score_status(self, metadata, score_range, status):
+        """Test that each scenario lands in its expected score range and status."""
+        result = _score(metadata)
 
-        assert result.total_score == 0
-        assert result.status == ReadinessStatus.DRAFT
+        assert score_range[0] <= result.total_score <= score_range[1]
+        assert result.status == status
         assert len(result.dimension_scores) == 6
-        # Should have many reasons for missing items
-        assert len(result.reasons) > 0
-        # Should have actionable recommendations
-        assert len(result.actions) > 0
+        # Anything short of a perfect score should explain itself and suggest fixes
+        if result.total_score < 100:
+            assert len(result.reasons) > 0
+            assert len(result.actions) > 0
+
+    def test_perfect_gold_dataset_has_no_gaps(self):
+        """Test that a perfect dataset maxes every dimension with no reasons."""
+        result = _score(GOLD_METADATA)
+
+        assert all(dim.points_awarded == dim.max_points for dim in result.dimension_scores)
+        assert len(result.reasons) == 0
 
     def test_partial_ownership_only(self):
         """Test dataset with only owner information."""
@@ -68,44 +138,12 @@ class TestScoringEngine:
             "owner_contact": "john@example.com",
         }
 
-        result = score_dataset(metadata)
+        result = _score(metadata)
 
-        # Should score 15 points from ownership dimension
-        assert result.total_score == 15
-        assert result.status == ReadinessStatus.DRAFT
         # Ownership should be perfect
-        ownership_dim = next(d for d in result.dimension_scores if d.dimension_key == "ownership")
+        ownership_dim = _by_key(result)["ownership"]
         assert ownership_dim.points_awarded == 15
 
-    def test_production_ready_with_gaps(self):
-        """Test a dataset that scores in Production-Ready range (70-84)."""
-        metadata = {
-            "owner_name": "Data Team",
-            "owner_contact": "#data-team",
-            "description": "User analytics table",
-            "columns": [
-                {"name": "user_id", "description": "User ID"},
-                {"name": "event_type", "description": "Event type"},
-                {"name": "timestamp"},  # Missing description
-                {"name": "data"},  # Missing description
-            ],
-            "intended_use": "Analytics",
-            "limitations": "Some data quality issues",
-            "has_freshness_checks": True,
-            "has_volume_checks": False,
-            "has_sla": False,
-            "has_release_notes": False,
-        }
-
-        result = score_dataset(metadata)
-
-        assert 70 <= result.total_score <= 84
-        assert result.status == ReadinessStatus.PRODUCTION_READY
-        # Should have some reasons
-        assert len(result.reasons) > 0
-        # Should have actionable improvements
-        assert len(result.actions) > 0
-
     def test_schema_hygiene_issues(self):
         """Test dataset with schema hygiene problems."""
         metadata = {
@@ -118,15 +156,14 @@ class TestScoringEngine:
             ],
         }
 
-        result = score_dataset(metadata)
+        result = _score(metadata)
 
-        schema_dim = next(d for d in result.dimension_scores if d.dimension_key == "schema_hygiene")
+        schema_dim = _by_key(result)["schema_hygiene"]
         # Should lose points for naming and legacy columns
         assert schema_dim.points_awarded < schema_dim.max_points
 
         # Should have reasons for schema issues
-        schema_reasons = [r for r in result.reasons if r.dimension_key == "schema_hygiene"]
-        assert len(schema_reasons) > 0
+        assert any(r.dimension_key == "schema_hygiene" for r in result.reasons)
 
     def test_documentation_coverage(self):
         """Test documentation scoring with partial column coverage."""
@@ -142,34 +179,18 @@ class TestScoringEngine:
             ],
         }
 
-        result = score_dataset(metadata)
+        result = _score(metadata)
 
         # 2 out of 5 columns documented = 40% < 80% threshold
-        doc_dim = next(d for d in result.dimension_scores if d.dimension_key == "documentation")
+        doc_dim = _by_key(result)["documentation"]
         # Should have description points (5) but not column doc points (10)
         assert doc_dim.points_awarded == 5
 
         # Should have reason for insufficient column docs
-        doc_reasons = [r for r in result.reasons if r.dimension_key == "documentation"]
-        assert any("column" in r.message.lower() for r in doc_reasons)
-
-    def test_internal_status_dataset(self):
-        """Test a dataset that scores in Internal range (50-69)."""
-        metadata = {
-            "owner_name": "Team C",
-            "description": "Some description",
-            "columns": [
-                {"name": "id", "description": "ID"},
-                {"name": "name", "description": "Name"},
-            ],
-            "intended_use": "Internal use",
-            "has_freshness_checks": True,
-        }
-
-        result = score_dataset(metadata)
-
-        assert 50 <= result.total_score <= 69
-        assert result.status == ReadinessStatus.INTERNAL
+        assert any(
+            r.dimension_key == "documentation" and "column" in r.message.lower()
+            for r in result.reasons
+        )
 
     def test_data_quality_signals(self):
         """Test data quality dimension scoring."""
@@ -182,9 +203,9 @@ class TestScoringEngine:
             "intended_use": "Production analytics",
         }
 
-        result = score_dataset(metadata)
+        result = _score(metadata)
 
-        quality_dim = next(d for d in result.dimension_scores if d.dimension_key == "data_quality")
+        quality_dim = _by_key(result)["data_quality"]
         # Should have points for checks (10) and SLA (5)
         assert quality_dim.points_awarded >= 15
 
@@ -198,16 +219,15 @@ class TestScoringEngine:
             "limitations": "None",
         }
 
-        result = score_dataset(metadata)
+        result = _score(metadata)
 
         # Should not have penalties for fields we can't measure
         # (e.g., unresolved_failures_30d, breaking_changes_30d if not provided)
-        stability_dim = next(d for d in result.dimension_scores if d.dimension_key == "stability")
+        stability_dim = _by_key(result)["stability"]
         # Should not lose points for breaking_changes if not provided
-        breaking_reasons = [
-            r for r in result.reasons
-            if r.dimension_key == "stability" and "breaking" in r.reason_code
-        ]
         # If breaking_changes_30d not provided, should not have this reason
-        assert len(breaking_reasons) == 0
+        assert not any(
+            r.dimension_key == "stability" and "breaking" in r.reason_code
+            for r in result.reasons
+        )
 